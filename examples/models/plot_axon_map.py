@@ -86,9 +86,12 @@ print(model)
 # simulations:
 #
 # * ``engine``:
-#    * 'serial': single-core processing (no parallelization)
-#    * 'joblib': parallelization using the `JobLib`_ library
-#    * 'dask': parallelization using the `Dask`_ library
+#    * 'serial': processes the whole grid at once, using all CPU cores (the
+#      axon bundles are grown one after the other when building the model)
+#    * 'joblib': parallelization using the `JobLib`_ library (deprecated for
+#      predicting a single percept; use it to sweep over implants instead)
+#    * 'dask': parallelization using the `Dask`_ library (deprecated for
+#      predicting a single percept; use it to sweep over implants instead)
 #
 # * ``scheduler``:
 #    * 'threading': a scheduler backed by a thread pool
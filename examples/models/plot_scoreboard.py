@@ -71,9 +71,11 @@ print(model)
 # simulations:
 #
 # * ``engine``:
-#    * 'serial': single-core processing (no parallelization)
-#    * 'joblib': parallelization using the `JobLib`_ library
-#    * 'dask': parallelization using the `Dask`_ library
+#    * 'serial': processes the whole grid at once, using all CPU cores
+#    * 'joblib': parallelization using the `JobLib`_ library (deprecated for
+#      predicting a single percept; use it to sweep over implants instead)
+#    * 'dask': parallelization using the `Dask`_ library (deprecated for
+#      predicting a single percept; use it to sweep over implants instead)
 #
 # * ``scheduler``:
 #    * 'threading': a scheduler backed by a thread pool
@@ -138,6 +138,28 @@ class ElectrodeArray(PrettyPrint):
     @electrodes.setter
     def electrodes(self, electrodes):
         self._electrodes = electrodes
+        # In addition to the dictionary of Electrode objects, the electrode
+        # coordinates are stored in contiguous NumPy arrays (one per axis), so
+        # that models can pass them straight to their kernels. These are
+        # (re-)built by ``_update_coords`` whenever they are out of date:
+        self._coords = None
+        self._update_coords()
+
+    def _update_coords(self):
+        """Rebuild the coordinate arrays if any electrode has changed
+
+        Electrodes can be moved (e.g., ``earray['A1'].x += 100``), added, or
+        replaced through the ``electrodes`` dict at any time. The arrays are
+        therefore rebuilt whenever the current electrode coordinates differ
+        from the ones they were last built from.
+        """
+        coords = [(e.x, e.y, e.z) for e in self._electrodes.values()]
+        if coords == self._coords:
+            return
+        self._x = np.array([c[0] for c in coords], dtype=float)
+        self._y = np.array([c[1] for c in coords], dtype=float)
+        self._z = np.array([c[2] for c in coords], dtype=float)
+        self._coords = coords
 
     @property
     def n_electrodes(self):
@@ -216,6 +238,44 @@ class ElectrodeArray(PrettyPrint):
                 raise StopIteration
             return None
 
+    def _get_coords(self, names):
+        """Return the (x, y, z) coordinates of a list of electrodes
+
+        Parameters
+        ----------
+        names : list of int|str|...
+            Electrode names, e.g. the electrodes of a stimulus. Like in
+            ``__getitem__``, a name that is not a key of the array is
+            interpreted as an index into the list of electrodes.
+
+        Returns
+        -------
+        x, y, z : 1D arrays
+            Electrode coordinates in the order given by ``names``. If
+            ``names`` lists all electrodes of the array in order, the internal
+            coordinate arrays are returned without making a copy.
+        """
+        self._update_coords()
+        keys = list(self.electrodes.keys())
+        if len(names) == len(keys) and all(n == k for n, k in zip(names,
+                                                                  keys)):
+            return self._x, self._y, self._z
+        lookup = {key: idx for idx, key in enumerate(keys)}
+        idx = []
+        for name in names:
+            try:
+                idx.append(lookup[name])
+            except (KeyError, TypeError):
+                # If not a dict key, `name` might be an int index into the
+                # list:
+                try:
+                    idx.append(range(len(keys))[name])
+                except (IndexError, TypeError):
+                    raise ValueError(("Electrode %s not found in the "
+                                      "array.") % name)
+        idx = np.array(idx, dtype=int)
+        return self._x[idx], self._y[idx], self._z[idx]
+
     def __iter__(self):
         return iter(self.electrodes)
 
@@ -572,6 +632,10 @@ class ProsthesisSystem(PrettyPrint):
         >>> from pulse2percept.implants import ArgusII
         >>> implant = ArgusII(stim={'B7': 13})
 
+        Stimulate all electrodes in Argus II with 10 uA:
+
+        >>> implant = ArgusII(stim=10)
+
         """
         return self._stim
 
@@ -584,6 +648,10 @@ class ProsthesisSystem(PrettyPrint):
             if isinstance(data, dict):
                 # Electrode names already provided by keys:
                 stim = Stimulus(data)
+            elif np.isscalar(data) and not isinstance(data, str):
+                # A scalar is applied to all electrodes:
+                stim = Stimulus(np.full(self.n_electrodes, data, dtype=float),
+                                electrodes=list(self.earray.keys()))
             else:
                 # Use electrode names as stimulus coordinates:
                 stim = Stimulus(data, electrodes=list(self.earray.keys()))
@@ -143,6 +143,12 @@ def test_ElectrodeArray_add_electrode():
         npt.assert_equal(isinstance(selected[0], PointSource), True)
         npt.assert_equal(isinstance(selected[1], DiskElectrode), True)
 
+    # Coordinates are also stored in contiguous arrays:
+    x, y, z = earray._get_coords([key0, key1])
+    npt.assert_almost_equal(x, [0, 4])
+    npt.assert_almost_equal(y, [1, 5])
+    npt.assert_almost_equal(z, [2, 6])
+
 
 def test_ElectrodeArray_add_electrodes():
     earray = ElectrodeArray([])
@@ -192,6 +198,47 @@ def test_ElectrodeArray_add_electrodes():
         npt.assert_equal(earray[i], val)
 
 
+def test_ElectrodeArray__get_coords():
+    earray = ElectrodeArray({'A1': PointSource(0, 1, 2),
+                             'B2': DiskElectrode(3, 4, 5, 6)})
+    earray.add_electrode('C3', PointSource(7, 8, 9))
+    # All electrodes in order: no copy
+    x, y, z = earray._get_coords(['A1', 'B2', 'C3'])
+    npt.assert_equal(x is earray._x, True)
+    npt.assert_almost_equal(x, [0, 3, 7])
+    npt.assert_almost_equal(y, [1, 4, 8])
+    npt.assert_almost_equal(z, [2, 5, 9])
+    # A subset in different order:
+    x, y, z = earray._get_coords(np.array(['C3', 'A1']))
+    npt.assert_almost_equal(x, [7, 0])
+    npt.assert_almost_equal(y, [8, 1])
+    npt.assert_almost_equal(z, [9, 2])
+    # Like __getitem__, an int that is not a key indexes into the list:
+    x, y, z = earray._get_coords([2, 0])
+    npt.assert_almost_equal(x, [7, 0])
+    npt.assert_almost_equal(y, [8, 1])
+    npt.assert_almost_equal(z, [9, 2])
+    # Invalid electrode name:
+    with pytest.raises(ValueError):
+        earray._get_coords(['D4'])
+    with pytest.raises(ValueError):
+        earray._get_coords([3])
+    # Moving an electrode updates the coordinates:
+    earray['A1'].x += 1000
+    earray['C3'].z = -1
+    x, y, z = earray._get_coords(['A1', 'B2', 'C3'])
+    npt.assert_almost_equal(x, [1000, 3, 7])
+    npt.assert_almost_equal(z, [2, 5, -1])
+    # So does replacing an electrode in the dict:
+    earray.electrodes['B2'] = PointSource(-3, -4, -5)
+    x, y, z = earray._get_coords(['B2'])
+    npt.assert_almost_equal(x, [-3])
+    npt.assert_almost_equal(y, [-4])
+    # Reassigning the electrode dict updates the coordinates:
+    earray.electrodes = coll.OrderedDict([('B2', earray['B2'])])
+    npt.assert_almost_equal(earray._get_coords(['B2'])[0], [-3])
+
+
 def test_ElectrodeGrid():
     # Must pass in tuple/list of (rows, cols) for grid shape:
     with pytest.raises(TypeError):
@@ -344,6 +391,14 @@ def test_ProsthesisSystem():
     npt.assert_equal(implant.stim.time, None)
     npt.assert_equal(implant.stim.electrodes, [0])
 
+    # A scalar is applied to all electrodes:
+    implant = ProsthesisSystem(ElectrodeGrid((2, 3), spacing=100))
+    implant.stim = 3
+    npt.assert_equal(implant.stim.shape, (6, 1))
+    npt.assert_almost_equal(implant.stim.data, 3)
+    npt.assert_equal(implant.stim.time, None)
+    npt.assert_equal(implant.stim.electrodes, list(implant.earray.keys()))
+
     with pytest.raises(ValueError):
         # Wrong number of stimuli
         implant.stim = [1, 2]
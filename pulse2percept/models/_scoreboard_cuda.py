@@ -0,0 +1,103 @@
+"""CUDA kernels for the scoreboard model"""
+import math
+import functools
+import numpy as np
+
+# Numba's CUDA support is optional. Checking for a GPU initializes the CUDA
+# driver, so nothing CUDA-related happens until ``engine='cuda'`` is used:
+try:
+    from numba import cuda, float64
+except ImportError:
+    cuda = None
+
+# Electrode coordinates and amplitudes are staged in shared memory in chunks
+# of this size (3 x 1024 doubles = 24 kB, well below the 48 kB per block):
+MAX_ELECTRODES = 1024
+THREADS_PER_BLOCK = 256
+
+
+def _scoreboard_cuda(xg, yg, xe, ye, amps, rho2_inv, thresh, out):
+    """Calculates the scoreboard brightness, one thread per pixel"""
+    shared_xe = cuda.shared.array(MAX_ELECTRODES, float64)
+    shared_ye = cuda.shared.array(MAX_ELECTRODES, float64)
+    shared_amps = cuda.shared.array(MAX_ELECTRODES, float64)
+    p = cuda.grid(1)
+    n_pix = out.shape[0]
+    n_el = xe.shape[0]
+    bright = 0.0
+    for start in range(0, n_el, MAX_ELECTRODES):
+        n_chunk = min(MAX_ELECTRODES, n_el - start)
+        # All threads in the block cooperatively copy a chunk of electrodes
+        # to shared memory:
+        for e in range(cuda.threadIdx.x, n_chunk, cuda.blockDim.x):
+            shared_xe[e] = xe[start + e]
+            shared_ye[e] = ye[start + e]
+            shared_amps[e] = amps[start + e]
+        cuda.syncthreads()
+        # Threads beyond the last pixel must still reach ``syncthreads``:
+        if p < n_pix:
+            for e in range(n_chunk):
+                dx = xg[p] - shared_xe[e]
+                dy = yg[p] - shared_ye[e]
+                bright += shared_amps[e] * math.exp(-(dx * dx + dy * dy) *
+                                                    rho2_inv)
+        cuda.syncthreads()
+    if p < n_pix:
+        if bright < thresh:
+            bright = 0.0
+        out[p] = bright
+
+
+@functools.lru_cache(maxsize=None)
+def is_cuda_available():
+    """Returns True if Numba's CUDA support and a CUDA-capable GPU are present
+
+    The CUDA simulator (``NUMBA_ENABLE_CUDASIM=1``) also counts as a GPU. The
+    result is cached after the first call.
+    """
+    return cuda is not None and cuda.is_available()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_scoreboard_cuda():
+    """Compiles the CUDA kernel on first use"""
+    return cuda.jit(_scoreboard_cuda)
+
+
+def scoreboard_cuda(xg, yg, xe, ye, amps, rho2_inv, thresh):
+    """Calculates the scoreboard brightness on the GPU
+
+    Parameters
+    ----------
+    xg, yg : 1D array
+        x,y coordinates of every pixel in microns
+    xe, ye : 1D array
+        x,y coordinates of every electrode in microns
+    amps : 1D array
+        Current amplitude applied to every electrode
+    rho2_inv : double
+        ``1 / (2 * rho ** 2)``, where ``rho`` is the Gaussian decay constant
+    thresh : double
+        Brightness values below ``thresh`` are set to zero
+
+    Returns
+    -------
+    bright : 1D array
+        The brightness of every pixel
+    """
+    if not is_cuda_available():
+        raise ImportError("You do not have a CUDA-capable GPU or Numba's CUDA "
+                          "support installed. Consider setting `engine` to "
+                          "'serial'.")
+    n_pix = len(xg)
+    d_out = cuda.device_array(n_pix, dtype=np.float64)
+    n_blocks = (n_pix + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+    _get_scoreboard_cuda()[n_blocks, THREADS_PER_BLOCK](
+        cuda.to_device(np.ascontiguousarray(xg, dtype=np.float64)),
+        cuda.to_device(np.ascontiguousarray(yg, dtype=np.float64)),
+        cuda.to_device(np.ascontiguousarray(xe, dtype=np.float64)),
+        cuda.to_device(np.ascontiguousarray(ye, dtype=np.float64)),
+        cuda.to_device(np.ascontiguousarray(amps, dtype=np.float64)),
+        rho2_inv, thresh, d_out
+    )
+    return d_out.copy_to_host()
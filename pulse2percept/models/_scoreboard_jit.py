@@ -0,0 +1,66 @@
+"""Numba kernels for the scoreboard model"""
+import numpy as np
+
+# Numba is optional. If it is not installed, the kernel below remains a
+# (slow) pure-Python function and the model falls back to NumPy:
+try:
+    from numba import njit, prange
+    has_jit = True
+except ImportError:
+    prange = range
+    has_jit = False
+
+
+# Pixels are processed in tiles of this size, so that the per-pixel
+# accumulators stay in L1 cache while looping over all electrodes:
+TILE_SIZE = 64
+
+# Gaussian contributions smaller than ``exp(-GAUSS_CUTOFF)`` (~2e-9) are
+# skipped without evaluating ``exp``. Far away from an electrode, this avoids
+# most transcendental function calls:
+GAUSS_CUTOFF = 20.0
+
+
+def scoreboard_kernel(xg, yg, xe, ye, amps, rho2_inv, thresh, out):
+    """Calculates the scoreboard brightness for a list of pixels
+
+    Parameters
+    ----------
+    xg, yg : 1D array
+        x,y coordinates of every pixel in microns
+    xe, ye : 1D array
+        x,y coordinates of every electrode in microns
+    amps : 1D array
+        Current amplitude applied to every electrode
+    rho2_inv : double
+        ``1 / (2 * rho ** 2)``, where ``rho`` is the Gaussian decay constant
+    thresh : double
+        Brightness values below ``thresh`` are set to zero
+    out : 1D array
+        Output array (same size as ``xg``), which will hold the brightness
+        of every pixel
+    """
+    n_pix = xg.shape[0]
+    n_el = xe.shape[0]
+    n_tiles = (n_pix + TILE_SIZE - 1) // TILE_SIZE
+    # Squared distance beyond which an electrode's contribution is negligible:
+    d2_cutoff = GAUSS_CUTOFF / rho2_inv
+    for tile in prange(n_tiles):
+        p_start = tile * TILE_SIZE
+        p_end = min(p_start + TILE_SIZE, n_pix)
+        for p in range(p_start, p_end):
+            out[p] = 0.0
+        for e in range(n_el):
+            for p in range(p_start, p_end):
+                d2 = (xg[p] - xe[e]) ** 2 + (yg[p] - ye[e]) ** 2
+                if d2 > d2_cutoff:
+                    continue
+                out[p] += amps[e] * np.exp(-d2 * rho2_inv)
+        for p in range(p_start, p_end):
+            if out[p] < thresh:
+                out[p] = 0.0
+
+
+if has_jit:
+    scoreboard_kernel = njit(parallel=True, fastmath=True,
+                             cache=True)(scoreboard_kernel)
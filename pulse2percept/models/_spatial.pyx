@@ -0,0 +1,239 @@
+import numpy as np
+cimport numpy as np
+import cython
+from cython.parallel import prange
+from libc.math cimport(pow as c_pow, exp as c_exp, tanh as c_tanh,
+                       sin as c_sin, cos as c_cos)
+
+
+cdef deg2rad = 3.14159265358979323846 / 180.0
+
+
+cdef inline double _dist2(double x0, double y0, double x1,
+                          double y1) nogil:
+    """Squared Euclidean distance between (x0, y0) and (x1, y1)"""
+    cdef double dx = x0 - x1
+    cdef double dy = y0 - y1
+    return dx * dx + dy * dy
+
+
+cdef inline double _gauss(double d2, double rho2_inv) nogil:
+    """Gaussian of squared distance ``d2``, with ``rho2_inv = 1/(2 rho^2)``"""
+    return c_exp(-d2 * rho2_inv)
+
+
+cdef double c_min(double[:] arr):
+    cdef double arr_min
+    cdef np.intp_t idx, arr_len
+
+    arr_min = 1e12
+    arr_len = len(arr)
+    for idx in range(arr_len):
+        if arr[idx] < arr_min:
+            arr_min = arr[idx]
+    return arr_min
+
+cdef double c_max(double[:] arr):
+    cdef double arr_max
+    cdef np.intp_t idx, arr_len
+
+    arr_max = -1e12
+    arr_len = len(arr)
+    for idx in range(arr_len):
+        if arr[idx] > arr_max:
+            arr_max = arr[idx]
+    return arr_max
+
+
+cpdef scoreboard(double[:] stim, double[:] xel, double[:] yel,
+                 double xtissue, double ytissue, double rho2_inv, double th):
+    cdef np.intp_t idx, n_stim
+    cdef double bright
+    n_stim = len(stim)
+    bright = 0.0
+    if n_stim == 0:
+        return bright
+    # rho2_inv = 1 / (2 * rho ** 2) is precomputed by the caller, so that the
+    # inner loop does not need a division:
+    with nogil:
+        for idx in range(n_stim):
+            bright += stim[idx] * _gauss(_dist2(xtissue, ytissue, xel[idx],
+                                                yel[idx]), rho2_inv)
+    if bright < th:
+        bright = 0
+    return bright
+
+
+cpdef scoreboard_grid(double[:] stim, double[:] xel, double[:] yel,
+                      double[:] xtissue, double[:] ytissue, double rho2_inv,
+                      double th):
+    """Scoreboard brightness of every pixel, spread across all CPU cores"""
+    cdef np.intp_t p, idx, n_pix, n_stim
+    cdef double px_bright
+    n_pix = len(xtissue)
+    n_stim = len(stim)
+    cdef double[:] bright = np.empty(n_pix)
+    # Every pixel is independent, so the pixels can be split across OpenMP
+    # threads without holding the GIL:
+    for p in prange(n_pix, nogil=True, schedule='static'):
+        px_bright = 0.0
+        for idx in range(n_stim):
+            # Note: ``px_bright += ...`` would turn this into a reduction
+            # over ``p``:
+            px_bright = px_bright + stim[idx] * _gauss(
+                _dist2(xtissue[p], ytissue[p], xel[idx], yel[idx]), rho2_inv)
+        if px_bright < th:
+            px_bright = 0.0
+        bright[p] = px_bright
+    return np.asarray(bright)
+
+
+cpdef gauss2(double[:, ::1] arr, double x, double y, double tau):
+    cdef np.intp_t idx, n_arr
+    cdef double tau2_inv
+    n_arr = arr.shape[0]
+    tau2_inv = 0.5 / (tau * tau)
+    cdef double[:] gauss = np.empty(n_arr)
+    with nogil:
+        for idx in range(n_arr):
+            gauss[idx] = _gauss(_dist2(arr[idx, 0], arr[idx, 1], x, y),
+                                tau2_inv)
+    return np.asarray(gauss)
+
+
+cpdef jansonius(double[:] rho, double phi0, double beta_s, double beta_i):
+    cdef double b, c, rho_min, tmp_phi, tmp_rho
+    cdef np.intp_t idx
+
+    if phi0 > 0:
+        # Axon is in superior retina, compute `b` (real number) from Eq. 5:
+        b = c_exp(beta_s + 3.9 * c_tanh(-(phi0 - 121.0) / 14.0))
+        # Equation 3, `c` a positive real number:
+        c = 1.9 + 1.4 * c_tanh((phi0 - 121.0) / 14.0)
+    else:
+        # Axon is in inferior retina: compute `b` (real number) from Eq. 6:
+        b = -c_exp(beta_i + 1.5 * c_tanh(-(-phi0 - 90.0) / 25.0))
+        # Equation 4, `c` a positive real number:
+        c = 1.0 + 0.5 * c_tanh((-phi0 - 90.0) / 25.0)
+
+    cdef double[:] xprime = np.empty_like(rho)
+    cdef double[:] yprime = np.empty_like(rho)
+    rho_min = c_min(rho)
+    for idx in range(len(rho)):
+        tmp_rho = rho[idx]
+        tmp_phi = phi0 + b * c_pow(tmp_rho - rho_min, c)
+        xprime[idx] = tmp_rho * c_cos(deg2rad * tmp_phi)
+        yprime[idx] = tmp_rho * c_sin(deg2rad * tmp_phi)
+    return np.asarray(xprime), np.asarray(yprime)
+
+
+cdef np.intp_t argmin_segment(double[:, :] bundles, double x, double y):
+    cdef double dist2, min_dist2
+    cdef np.intp_t seg, min_seg, n_seg
+
+    min_dist2 = 1e12
+    n_seg = bundles.shape[0]
+    for seg in range(n_seg):
+        dist2 = _dist2(bundles[seg, 0], bundles[seg, 1], x, y)
+        if dist2 < min_dist2:
+            min_dist2 = dist2
+            min_seg = seg
+    return min_seg
+
+
+cpdef axon_contribution(double[:, :] bundle, double[:] xy, double lmbd):
+    cdef np.intp_t p, c, argmin, n_seg
+    cdef double dist2, lmbd2_inv
+    cdef double[:, :] contrib
+
+    # Find the segment that is closest to the soma `xy`:
+    argmin = argmin_segment(bundle, xy[0], xy[1])
+
+    # Add the exact location of the soma:
+    bundle[argmin + 1, 0] = xy[0]
+    bundle[argmin + 1, 1] = xy[1]
+
+    # For every axon segment, calculate distance from soma by summing up the
+    # individual distances between neighboring axon segments
+    # (by "walking along the axon"):
+    n_seg = argmin + 1
+    contrib = np.zeros((n_seg, 3))
+    lmbd2_inv = 0.5 / (lmbd * lmbd)
+    dist2 = 0
+    c = 0
+    for p in range(argmin, -1, -1):
+        dist2 += _dist2(bundle[p, 0], bundle[p, 1], bundle[p + 1, 0],
+                        bundle[p + 1, 1])
+        contrib[c, 0] = bundle[p, 0]
+        contrib[c, 1] = bundle[p, 1]
+        contrib[c, 2] = _gauss(dist2, lmbd2_inv)
+        c += 1
+    return np.asarray(contrib)
+
+
+cpdef finds_closest_axons(double[:, :] bundles, double[:] xret,
+                          double[:] yret):
+    cdef np.intp_t[:] closest_seg = np.empty(len(xret), dtype=int)
+    cdef np.intp_t n_xy, n_seg
+    n_xy = len(xret)
+    n_seg = bundles.shape[0]
+    for pos in range(n_xy):
+        closest_seg[pos] = argmin_segment(bundles, xret[pos], yret[pos])
+    return np.asarray(closest_seg)
+
+
+cpdef axon_map(double[:] stim, double[:] xel, double[:] yel,
+               double[:, ::1] axon, double rho, double th):
+    cdef np.intp_t i_stim, i_ax, n_stim, n_ax
+    cdef double bright, rho2_inv
+    n_stim = len(stim)
+    n_ax = axon.shape[0]
+    rho2_inv = 0.5 / (rho * rho)
+    cdef double[:] act = np.zeros(n_ax)
+    with nogil:
+        for i_stim in range(n_stim):
+            for i_ax in range(n_ax):
+                act[i_ax] += (stim[i_stim] * axon[i_ax, 2] *
+                              _gauss(_dist2(axon[i_ax, 0], axon[i_ax, 1],
+                                            xel[i_stim], yel[i_stim]),
+                                     rho2_inv))
+    bright = c_max(act)
+    if bright < th:
+        bright = 0
+    return bright
+
+
+cpdef axon_map_grid(double[:] stim, double[:] xel, double[:] yel,
+                    double[:, ::1] axons, np.intp_t[::1] offsets, double rho,
+                    double th):
+    """Axon map brightness of every pixel, spread across all CPU cores
+
+    ``axons`` holds the concatenated axon contributions of all pixels; the
+    segments of pixel ``p`` are ``axons[offsets[p]:offsets[p + 1]]``.
+    """
+    cdef np.intp_t p, i_stim, i_ax, n_pix, n_stim
+    cdef double px_bright, act, rho2_inv
+    n_pix = len(offsets) - 1
+    n_stim = len(stim)
+    rho2_inv = 0.5 / (rho * rho)
+    cdef double[:] bright = np.empty(n_pix)
+    for p in prange(n_pix, nogil=True, schedule='dynamic'):
+        # The brightest axon segment determines the brightness of the pixel.
+        # Pixels without an axon stay dark:
+        if offsets[p + 1] == offsets[p]:
+            px_bright = 0.0
+        else:
+            px_bright = -1e12
+        for i_ax in range(offsets[p], offsets[p + 1]):
+            act = 0.0
+            for i_stim in range(n_stim):
+                act = act + (stim[i_stim] * axons[i_ax, 2] *
+                             _gauss(_dist2(axons[i_ax, 0], axons[i_ax, 1],
+                                           xel[i_stim], yel[i_stim]),
+                                    rho2_inv))
+            if act > px_bright:
+                px_bright = act
+        if px_bright < th:
+            px_bright = 0.0
+        bright[p] = px_bright
+    return np.asarray(bright)
@@ -3,10 +3,11 @@
 import os
 import numpy as np
 import pickle
+import warnings
 
 from ..utils import parfor
 from ..models import BaseModel, Watson2014ConversionMixin, dva2ret
-from ..models._axon_map import axon_contribution, axon_map
+from ..models._spatial import axon_contribution, axon_map, axon_map_grid
 
 
 class AxonMapModel(Watson2014ConversionMixin, BaseModel):
@@ -21,11 +22,23 @@ class AxonMapModel(Watson2014ConversionMixin, BaseModel):
         Exponential decay constant along the axon (microns).
     rho : double
         Exponential decay constant away from the axon (microns).
+
+    .. deprecated:: 0.6
+
+        ``engine='joblib'`` and ``engine='dask'`` process the grid pixel by
+        pixel and are deprecated for predicting a percept. The default
+        ``engine='serial'`` already spreads the grid across all CPU cores.
+        Note that ``engine`` also applies to growing the axon bundles in
+        ``build``, which is therefore no longer parallelized by default.
     """
 
     def __init__(self, **kwargs):
         super(AxonMapModel, self).__init__(**kwargs)
         self.axon_contrib = None
+        # All axon contributions in a single array, where the segments of
+        # pixel ``i`` are ``_axon_flat[_axon_offsets[i]:_axon_offsets[i+1]]``:
+        self._axon_flat = None
+        self._axon_offsets = None
         self.xret = None
         self.yret = None
 
@@ -50,9 +63,13 @@ class AxonMapModel(Watson2014ConversionMixin, BaseModel):
             'axon_pickle': 'axons.pickle',
             # You can force a build by ignoring pickles:
             'ignore_pickle': False,
+            # The spatial kernel uses all CPU cores:
+            'engine': 'serial',
         }
-        params.update(base_params)
-        return params
+        # Model-specific values (e.g., ``engine``) take precedence over the
+        # BaseModel defaults:
+        base_params.update(params)
+        return base_params
 
     def _jansonius2009(self, phi0, beta_sup=-1.9, beta_inf=0.5, eye='RE'):
         """Grows a single axon bundle based on the model by Jansonius (2009)
@@ -307,6 +324,12 @@ class AxonMapModel(Watson2014ConversionMixin, BaseModel):
             axons = self.find_closest_axon(bundles)
         # Calculate axon contributions (depends on axlambda):
         self.axon_contrib = self.calc_axon_contribution(axons)
+        self._axon_offsets = np.cumsum([0] + [len(ax) for ax in
+                                              self.axon_contrib],
+                                       dtype=np.intp)
+        self._axon_flat = np.ascontiguousarray(
+            np.concatenate(self.axon_contrib), dtype=np.float64
+        ).reshape((-1, 3))
         # Pickle axons along with all important parameters:
         params = {'loc_od_x': self.loc_od_x, 'loc_od_y': self.loc_od_y,
                   'n_axons': self.n_axons, 'axons_range': self.axons_range,
@@ -326,15 +349,32 @@ class AxonMapModel(Watson2014ConversionMixin, BaseModel):
         if axon.shape[0] == 0:
             return 0.0
         # Calculate the brightness at pixel:
-        electrodes = implant.stim.electrodes
-        bright = axon_map(implant.stim.data[:, 0],
-                          np.array([implant[e].x for e in electrodes]),
-                          np.array([implant[e].y for e in electrodes]),
-                          axon,
+        xel, yel, _ = implant.earray._get_coords(implant.stim.electrodes)
+        bright = axon_map(implant.stim.data[:, 0], xel, yel, axon,
                           self.rho,
                           self.thresh_percept)
         return bright
 
+    def _predict_spatial(self, implant, t=None):
+        """Predicts the brightness at every pixel location of the grid
+
+        With ``engine='serial'``, all pixels are processed at once by a Cython
+        kernel that releases the GIL and uses OpenMP threads. All other
+        engines process the grid pixel by pixel and are deprecated.
+        """
+        if self.engine != 'serial':
+            warnings.warn("engine='%s' is deprecated for predicting a percept "
+                          "since version 0.6. Use engine='serial', which "
+                          "already uses all CPU cores." % self.engine,
+                          category=DeprecationWarning)
+            return super(AxonMapModel, self)._predict_spatial(implant, t=t)
+        xel, yel, _ = implant.earray._get_coords(implant.stim.electrodes)
+        bright = axon_map_grid(np.ascontiguousarray(implant.stim.data[:, 0],
+                                                    dtype=np.float64),
+                               xel, yel, self._axon_flat, self._axon_offsets,
+                               self.rho, self.thresh_percept)
+        return bright.reshape(self.grid.shape)
+
     def predict_percept(self, implant, t=None):
         # Need to add an additional check before running the base method:
         if implant.eye != self.eye:
@@ -225,6 +225,22 @@ class BaseModel(Frozen, PrettyPrint, metaclass=abc.ABCMeta):
 
         # The stimulus does not have a time dimesnion. In this case, we
         # only need to run the spatial model:
+        return self._predict_spatial(implant, t=t)
+
+    def _predict_spatial(self, implant, t=None):
+        """Predicts the brightness at every pixel location of the grid
+
+        By default, ``_predict_pixel_percept`` is applied to every pixel using
+        the parallelization back end specified by ``engine``. Models that can
+        calculate the whole grid at once may override this method.
+
+        Parameters
+        ----------
+        implant : :py:class:`~pulse2percept.implants.ProsthesisSystem`
+            A ProsthesisSystem object with an assigned stimulus
+        t : optional
+            Not yet implemented.
+        """
         return parfor(self._predict_pixel_percept,
                       enumerate(self.grid),
                       func_args=[implant],
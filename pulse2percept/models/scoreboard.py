@@ -1,17 +1,206 @@
 import numpy as np
+import warnings
 from ..models import BaseModel, Watson2014ConversionMixin
-from ..models._scoreboard import scoreboard
+from ..models._spatial import scoreboard, scoreboard_grid
+from ..models._scoreboard_jit import scoreboard_kernel, has_jit
+from ..models._scoreboard_cuda import scoreboard_cuda
+
+
+def predict_spatial_vectorized(xg, yg, xe, ye, amps, rho):
+    """Predicts the scoreboard brightness on a whole grid at once
+
+    Instead of looping over pixels, the Gaussian is evaluated for every
+    (pixel, electrode) pair using NumPy broadcasting, followed by an
+    amplitude-weighted sum over electrodes.
+
+    Parameters
+    ----------
+    xg, yg : array-like
+        x,y coordinates of the grid in microns (e.g., from a meshgrid)
+    xe, ye : array-like
+        x,y coordinates of the electrodes in microns. The last dimension
+        indexes electrodes; any leading dimensions are treated as a batch of
+        electrode configurations (e.g., an implant at different locations).
+    amps : array-like
+        Current amplitude applied to every electrode, broadcastable to the
+        shape of ``xe``. A scalar amplitude is factored out of the sum over
+        electrodes.
+    rho : double
+        Gaussian decay constant (microns)
+
+    Returns
+    -------
+    bright : array-like
+        The (unthresholded) brightness at every grid location, computed in
+        the floating point precision of the inputs. The shape is
+        ``xe.shape[:-1] + xg.shape``, i.e. the same as ``xg`` if there is no
+        batch dimension.
+    """
+    xg = np.asarray(xg)
+    yg = np.asarray(yg)
+    xe = np.asarray(xe)
+    ye = np.asarray(ye)
+    amps = np.asarray(amps)
+    # Insert singleton dimensions so that batch dimensions come first, then
+    # grid dimensions, then electrodes:
+    batch_shape = xe.shape[:-1]
+    el_shape = batch_shape + (1,) * xg.ndim + xe.shape[-1:]
+    grid_shape = (1,) * len(batch_shape) + xg.shape + (1,)
+    # The (batch, grid, electrodes) arrays are by far the largest ones, so
+    # all arithmetic is done in place on just two working buffers:
+    buf_shape = np.broadcast(xg.reshape(grid_shape),
+                             xe.reshape(el_shape)).shape
+    buf = np.empty(buf_shape, dtype=np.result_type(xg, yg, xe, ye, 1.0))
+    np.subtract(xg.reshape(grid_shape), xe.reshape(el_shape), out=buf)
+    np.square(buf, out=buf)
+    tmp = np.empty_like(buf)
+    np.subtract(yg.reshape(grid_shape), ye.reshape(el_shape), out=tmp)
+    np.square(tmp, out=tmp)
+    buf += tmp
+    del tmp
+    buf *= -0.5 / (rho * rho)
+    np.exp(buf, out=buf)
+    if amps.ndim == 0:
+        return amps * buf.sum(axis=-1)
+    amps = np.broadcast_to(amps, xe.shape)
+    return np.einsum('...e,...e->...', buf, amps.reshape(el_shape))
+
+
+def predict_spatial_separable(xg, yg, xe, ye, amps, rho):
+    """Predicts the scoreboard brightness on a rectangular grid
+
+    On a rectangular grid, every x coordinate is shared by a full column and
+    every y coordinate by a full row. Since the Gaussian is separable,
+    ``exp(-(dx^2 + dy^2) / (2 rho^2)) = exp(-dx^2 / (2 rho^2)) *
+    exp(-dy^2 / (2 rho^2))``, the percept reduces to a matrix product of a
+    (rows x electrodes) and an (electrodes x columns) matrix. This requires
+    only ``(n_rows + n_cols) * n_electrodes`` exponentials and works for any
+    electrode arrangement (e.g., rotated arrays).
+
+    Parameters
+    ----------
+    xg : 1D array
+        x coordinates of the grid columns in microns
+    yg : 1D array
+        y coordinates of the grid rows in microns
+    xe, ye : 1D array
+        x,y coordinates of the electrodes in microns
+    amps : 1D array or scalar
+        Current amplitude applied to every electrode. A scalar amplitude is
+        factored out of the sum over electrodes.
+    rho : double
+        Gaussian decay constant (microns)
+
+    Returns
+    -------
+    bright : 2D array
+        The (unthresholded) brightness at every grid location, with shape
+        ``(len(yg), len(xg))``, computed in the floating point precision of
+        the inputs
+    """
+    gauss_x, gauss_y = _separable_gaussians(xg, yg, xe, ye, rho)
+    return _separable_sum(gauss_x, gauss_y, amps)
+
+
+def _separable_gaussians(xg, yg, xe, ye, rho):
+    """Returns the (columns x electrodes) and (rows x electrodes) Gaussians
+
+    These only depend on the geometry, not on the stimulus.
+    """
+    rho2_inv = 0.5 / (rho * rho)
+    xg = np.asarray(xg)
+    yg = np.asarray(yg)
+    gauss_x = np.exp(-(xg[:, None] - xe) ** 2 * rho2_inv)
+    gauss_y = np.exp(-(yg[:, None] - ye) ** 2 * rho2_inv)
+    return gauss_x, gauss_y
+
+
+def _separable_sum(gauss_x, gauss_y, amps):
+    """Sums the amplitude-weighted separable Gaussians over electrodes"""
+    if np.ndim(amps) == 0:
+        # A uniform amplitude does not need to weigh every electrode:
+        return amps * np.dot(gauss_y, gauss_x.T)
+    return np.dot(gauss_y * amps, gauss_x.T)
 
 
 class ScoreboardModel(Watson2014ConversionMixin, BaseModel):
-    """Scoreboard model"""
+    """Scoreboard model
+
+    Parameters
+    ----------
+    rho : double
+        Gaussian decay constant (microns).
+    dtype : np.float32 or np.float64
+        Floating point precision of the spatial pass with ``engine='serial'``.
+        Single precision halves the memory traffic, which is plenty for a
+        perceptual brightness value. The other engines always use double
+        precision.
+
+    .. note::
+
+        With ``engine='serial'`` (the default), the whole grid is processed
+        at once by compiled kernels that use all CPU cores. In addition, the
+        scoreboard model can run on a CUDA-capable GPU with ``engine='cuda'``
+        (requires Numba). This pays off for large grids and electrode arrays.
+
+    .. deprecated:: 0.6
+
+        ``engine='joblib'`` and ``engine='dask'`` process the grid pixel by
+        pixel and are deprecated for predicting a percept. Use them only to
+        sweep over implants or model parameters.
+    """
+
+    def __init__(self, **kwargs):
+        super(ScoreboardModel, self).__init__(**kwargs)
+        # Tissue coordinates of the grid, calculated in ``build``:
+        self.xret = None
+        self.yret = None
+        # Whether the grid is rectangular in tissue coordinates (i.e., every
+        # row shares the same x and every column the same y):
+        self._is_separable = None
+        # The Gaussians of the separable spatial pass only depend on the
+        # geometry. They are cached as a ``(key, (gauss_x, gauss_y))`` tuple
+        # for the most recent set of electrode locations:
+        self._gauss_cache = None
 
     def _get_default_params(self):
         """Returns all settable parameters of the scoreboard model"""
         params = super(ScoreboardModel, self)._get_default_params()
-        params.update({'rho': 100, 'thresh_percept': 1.0 / np.sqrt(np.e)})
+        params.update({'rho': 100, 'thresh_percept': 1.0 / np.sqrt(np.e),
+                       'dtype': np.float64, 'engine': 'serial'})
         return params
 
+    def build(self, **build_params):
+        """Builds the model
+
+        The grid is converted to tissue coordinates once (contiguous and in
+        the precision given by ``dtype``), so that every call to
+        ``predict_percept`` can reuse them. Any cached geometry is discarded,
+        since the grid might have changed.
+        """
+        super(ScoreboardModel, self).build(**build_params)
+        dtype = np.dtype(self.dtype).type
+        xret, yret = self.get_tissue_coords(self.grid.x, self.grid.y)
+        self.xret = np.ascontiguousarray(xret, dtype=dtype)
+        self.yret = np.ascontiguousarray(yret, dtype=dtype)
+        self._is_separable = bool(np.all(self.xret == self.xret[:1, :]) and
+                                  np.all(self.yret == self.yret[:, :1]))
+        self._gauss_cache = None
+        return self
+
+    def _get_separable_gaussians(self, xg, yg, xel, yel):
+        """Returns the separable Gaussians, reusing them if possible
+
+        Repeated predictions with the same implant geometry (e.g., different
+        stimuli on the same implant) only need a matrix product.
+        """
+        key = (xel.tobytes(), yel.tobytes(), self.rho,
+               np.dtype(self.dtype).str)
+        if self._gauss_cache is None or self._gauss_cache[0] != key:
+            self._gauss_cache = (key, _separable_gaussians(xg, yg, xel, yel,
+                                                           self.rho))
+        return self._gauss_cache[1]
+
     def _predict_pixel_percept(self, xygrid, implant, t=None):
         """Predicts the brightness at a particular pixel location
 
@@ -26,12 +215,90 @@ class ScoreboardModel(Watson2014ConversionMixin, BaseModel):
         """
         idx_xy, xydva = xygrid
         # Call the Cython function for fast processing:
-        electrodes = implant.stim.electrodes
-        bright = scoreboard(implant.stim.data[:, 0],
-                            np.array([implant[e].x for e in electrodes]),
-                            np.array([implant[e].y for e in electrodes]),
+        xel, yel, _ = implant.earray._get_coords(implant.stim.electrodes)
+        bright = scoreboard(implant.stim.data[:, 0], xel, yel,
                             *self.get_tissue_coords(*xydva),
-                            self.rho,
+                            0.5 / (self.rho * self.rho),
                             self.thresh_percept)
         # return utils.Percept(self.xdva, self.ydva, brightness)
         return bright
+
+    def _predict_spatial(self, implant, t=None):
+        """Predicts the brightness at every pixel location of the grid
+
+        With ``engine='serial'``, all pixels are processed at once, using the
+        tissue coordinates calculated in ``build``. If the grid is rectangular
+        in tissue coordinates, this is done with
+        :py:func:`predict_spatial_separable` (reusing the Gaussians of the
+        previous call if the electrode locations did not change). Otherwise,
+        a parallel Numba kernel is used (if Numba is installed) or a
+        multi-threaded Cython kernel (falling back to
+        :py:func:`predict_spatial_vectorized` in single precision). With
+        ``engine='cuda'``, every pixel is processed by its own GPU thread. All
+        other engines process the grid pixel by pixel and are deprecated.
+        """
+        if self.engine == 'cuda':
+            xel, yel, _ = implant.earray._get_coords(implant.stim.electrodes)
+            bright = scoreboard_cuda(np.ravel(self.xret), np.ravel(self.yret),
+                                     xel, yel, implant.stim.data[:, 0],
+                                     0.5 / (self.rho * self.rho),
+                                     self.thresh_percept)
+            return bright.reshape(self.grid.shape)
+        if self.engine != 'serial':
+            warnings.warn("engine='%s' is deprecated for predicting a percept "
+                          "since version 0.6. Use engine='serial', which "
+                          "already uses all CPU cores." % self.engine,
+                          category=DeprecationWarning)
+            return super(ScoreboardModel, self)._predict_spatial(implant, t=t)
+        # ``dtype`` may be given as a scalar type (``np.float32``), a string
+        # (``'float32'``), or a ``np.dtype``. The scalar type is also needed
+        # to cast the scalar arguments of the Numba kernel:
+        dtype = np.dtype(self.dtype).type
+        xel, yel, _ = implant.earray._get_coords(implant.stim.electrodes)
+        xel = xel.astype(dtype, copy=False)
+        yel = yel.astype(dtype, copy=False)
+        amps = np.ascontiguousarray(implant.stim.data[:, 0], dtype=dtype)
+        # No copy is made unless ``dtype`` was changed after ``build``:
+        xret = self.xret.astype(dtype, copy=False)
+        yret = self.yret.astype(dtype, copy=False)
+        # Electrodes that receive no current do not contribute to the
+        # percept. Dropping them shrinks the loop over electrodes (e.g., to a
+        # single electrode if only one electrode of Argus II is active):
+        active = np.flatnonzero(amps)
+        amps = amps[active]
+        # A uniform stimulus (e.g., ``implant.stim = 10``) can be factored out
+        # of the sum over electrodes:
+        amp = amps[0] if amps.size and np.all(amps == amps[0]) else amps
+        if self._is_separable:
+            # Every row shares the same x, every column the same y. The cached
+            # Gaussians cover all electrodes, whether they are active or not:
+            gauss_x, gauss_y = self._get_separable_gaussians(xret[0, :],
+                                                             yret[:, 0],
+                                                             xel, yel)
+            if active.size < xel.size:
+                gauss_x = gauss_x[:, active]
+                gauss_y = gauss_y[:, active]
+            bright = _separable_sum(gauss_x, gauss_y, amp)
+            bright[bright < self.thresh_percept] = 0
+            return bright
+        xel = xel[active]
+        yel = yel[active]
+        if has_jit:
+            # Numba compiles a separate version of the kernel for every
+            # dtype, as long as all arguments (including scalars) match:
+            bright = np.empty(xret.size, dtype=dtype)
+            scoreboard_kernel(np.ravel(xret), np.ravel(yret), xel, yel, amps,
+                              dtype(0.5 / (self.rho * self.rho)),
+                              dtype(self.thresh_percept), bright)
+            return bright.reshape(self.grid.shape)
+        if dtype == np.float64:
+            # The Cython kernel releases the GIL and uses OpenMP threads:
+            bright = scoreboard_grid(amps, xel, yel, np.ravel(xret),
+                                     np.ravel(yret),
+                                     0.5 / (self.rho * self.rho),
+                                     self.thresh_percept)
+            return bright.reshape(self.grid.shape)
+        bright = predict_spatial_vectorized(xret, yret, xel, yel, amp,
+                                            self.rho)
+        bright[bright < self.thresh_percept] = 0
+        return bright
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+import warnings
 import numpy.testing as npt
 
 from pulse2percept import models
@@ -176,3 +177,28 @@ def test_AxonMapModel_predict_percept():
     # location on the retina):
     npt.assert_equal(np.sum(percept > 0.5), 58)
     npt.assert_equal(np.sum(percept > 0.275), 60)
+
+
+def test_AxonMapModel__predict_spatial():
+    # The multi-threaded 'serial' engine must give the same result as the
+    # pixel-by-pixel engines:
+    implant = implants.ArgusII(stim=np.arange(60) / 60.0)
+    serial = models.AxonMapModel(engine='serial', xystep=2, n_axons=100,
+                                 thresh_percept=0.1)
+    serial.build()
+    joblib = models.AxonMapModel(engine='joblib', n_jobs=1, xystep=2,
+                                 n_axons=100, thresh_percept=0.1)
+    joblib.build()
+    with pytest.deprecated_call():
+        npt.assert_almost_equal(serial.predict_percept(implant),
+                                joblib.predict_percept(implant))
+
+
+def test_AxonMapModel_default_engine():
+    # The multi-threaded 'serial' engine is the default and does not warn:
+    model = models.AxonMapModel(xystep=2, n_axons=100)
+    npt.assert_equal(model.engine, 'serial')
+    model.build()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        model.predict_percept(implants.ArgusII(stim=np.ones(60)))
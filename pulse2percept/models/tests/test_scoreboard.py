@@ -1,9 +1,15 @@
 import numpy as np
+import pytest
 import numpy.testing as npt
 
 from pulse2percept import implants
 from pulse2percept import stimuli
 from pulse2percept import models
+from pulse2percept.models.scoreboard import (predict_spatial_vectorized,
+                                             predict_spatial_separable)
+from pulse2percept.models._spatial import scoreboard_grid
+from pulse2percept.models._scoreboard_jit import scoreboard_kernel, has_jit
+from pulse2percept.models._scoreboard_cuda import is_cuda_available
 
 
 def test_ScoreboardModel():
@@ -17,6 +23,11 @@ def test_ScoreboardModel():
     model.build(rho=987)
     npt.assert_equal(model.rho, 987)
 
+    # The grid is converted to tissue coordinates during the build:
+    xret, yret = model.get_tissue_coords(model.grid.x, model.grid.y)
+    npt.assert_almost_equal(model.xret, xret)
+    npt.assert_almost_equal(model.yret, yret)
+
     # Zero in = zero out:
     implant = implants.ArgusI(stim=np.zeros(16))
     npt.assert_almost_equal(model.predict_percept(implant), 0)
@@ -37,8 +48,258 @@ def test_ScoreboardModel_predict_percept():
     # Brightest pixel is in lower right:
     npt.assert_almost_equal(percept[18, 25], np.max(percept))
 
+    # Moving the electrode moves the percept:
+    implant = implants.ArgusII(stim=img_stim)
+    implant[47].x += 1000
+    percept = model.predict_percept(implant)
+    npt.assert_almost_equal(percept[18, 25], 0)
+    npt.assert_equal(np.max(percept) > 0.1, True)
+
+    # Electrodes can be addressed by index:
+    npt.assert_almost_equal(
+        model.predict_percept(implants.ArgusII(stim={5: 1.0})),
+        model.predict_percept(implants.ArgusII(stim={'A6': 1.0})))
+
     # Full Argus II: 60 bright spots
     model = models.ScoreboardModel(engine='serial', xystep=1, rho=100)
     model.build()
     percept = model.predict_percept(implants.ArgusII(stim=np.ones(60)))
     npt.assert_equal(np.sum(np.isclose(percept, 0.9, rtol=0.1, atol=0.1)), 60)
+
+
+def test_ScoreboardModel__predict_spatial():
+    # The vectorized 'serial' engine must give the same result as the
+    # pixel-by-pixel engines:
+    implant = implants.ArgusII(stim=np.arange(60) / 60.0)
+    serial = models.ScoreboardModel(engine='serial', xystep=1, rho=200)
+    serial.build()
+    joblib = models.ScoreboardModel(engine='joblib', n_jobs=1, xystep=1,
+                                    rho=200)
+    joblib.build()
+    with pytest.deprecated_call():
+        npt.assert_almost_equal(serial.predict_percept(implant),
+                                joblib.predict_percept(implant))
+
+    # Thresholding works the same:
+    serial.thresh_percept = 0.5
+    joblib.thresh_percept = 0.5
+    with pytest.deprecated_call():
+        npt.assert_almost_equal(serial.predict_percept(implant),
+                                joblib.predict_percept(implant))
+
+
+def test_scoreboard_grid():
+    xg, yg = np.meshgrid(np.linspace(-2000, 2000, 31),
+                         np.linspace(-1500, 1500, 23))
+    xe = np.array([-500.0, 0.0, 800.0])
+    ye = np.array([300.0, 0.0, -200.0])
+    amps = np.array([1.0, 2.0, 0.5])
+    rho = 150.0
+    bright = scoreboard_grid(amps, xe, ye, xg.ravel(), yg.ravel(),
+                             0.5 / rho ** 2, 0.0)
+    npt.assert_almost_equal(bright.reshape(xg.shape),
+                            predict_spatial_vectorized(xg, yg, xe, ye, amps,
+                                                       rho))
+    # Thresholding:
+    bright = scoreboard_grid(amps, xe, ye, xg.ravel(), yg.ravel(),
+                             0.5 / rho ** 2, 0.5)
+    npt.assert_equal(np.all((bright == 0) | (bright >= 0.5)), True)
+
+
+@pytest.mark.skipif(not has_jit, reason="Numba not installed")
+def test_scoreboard_kernel():
+    xg, yg = np.meshgrid(np.linspace(-2000, 2000, 31),
+                         np.linspace(-1500, 1500, 23))
+    xe = np.array([-500.0, 0.0, 800.0])
+    ye = np.array([300.0, 0.0, -200.0])
+    amps = np.array([1.0, 2.0, 0.5])
+    rho = 150.0
+    bright = np.empty(xg.size)
+    scoreboard_kernel(xg.ravel(), yg.ravel(), xe, ye, amps,
+                      0.5 / rho ** 2, 0.0, bright)
+    npt.assert_almost_equal(bright.reshape(xg.shape),
+                            predict_spatial_vectorized(xg, yg, xe, ye, amps,
+                                                       rho))
+    # Thresholding:
+    scoreboard_kernel(xg.ravel(), yg.ravel(), xe, ye, amps,
+                      0.5 / rho ** 2, 0.5, bright)
+    npt.assert_equal(np.all((bright == 0) | (bright >= 0.5)), True)
+
+
+def test_predict_spatial_vectorized():
+    xg, yg = np.meshgrid(np.linspace(-2000, 2000, 41),
+                         np.linspace(-1000, 1000, 21))
+    # Sweep a single electrode along the horizontal meridian in a single call
+    # by stacking all locations along a batch dimension:
+    xe = np.linspace(-1500, 1500, 11)
+    bright = predict_spatial_vectorized(xg, yg, xe[:, None],
+                                        np.zeros((11, 1)), 2.0, 100)
+    npt.assert_equal(bright.shape, (11,) + xg.shape)
+    for i, x in enumerate(xe):
+        npt.assert_almost_equal(bright[i],
+                                predict_spatial_vectorized(xg, yg, [x], [0],
+                                                           [2.0], 100))
+    # Peak brightness does not depend on location:
+    npt.assert_almost_equal(bright.max(axis=(1, 2)), 2.0)
+
+
+@pytest.mark.parametrize('rot', (0, 0.3))
+def test_predict_spatial_separable(rot):
+    x = np.linspace(-3000, 3000, 41)
+    y = np.linspace(-2000, 2000, 27)
+    implant = implants.ArgusI(rot=rot, stim=np.arange(16) / 4.0)
+    xe, ye, _ = implant.earray._get_coords(implant.stim.electrodes)
+    amps = implant.stim.data[:, 0]
+    bright = predict_spatial_separable(x, y, xe, ye, amps, 300)
+    npt.assert_equal(bright.shape, (len(y), len(x)))
+    npt.assert_almost_equal(bright,
+                            predict_spatial_vectorized(*np.meshgrid(x, y),
+                                                       xe, ye, amps, 300))
+
+
+def test_predict_spatial_uniform_amps():
+    # A scalar amplitude gives the same result as a uniform array:
+    x = np.linspace(-3000, 3000, 41)
+    y = np.linspace(-2000, 2000, 27)
+    earray = implants.ArgusI(rot=0.3).earray
+    xe, ye, _ = earray._get_coords(list(earray.keys()))
+    uniform = 2.5 * np.ones_like(xe)
+    npt.assert_almost_equal(predict_spatial_separable(x, y, xe, ye, 2.5, 300),
+                            predict_spatial_separable(x, y, xe, ye, uniform,
+                                                      300))
+    xg, yg = np.meshgrid(x, y)
+    npt.assert_almost_equal(predict_spatial_vectorized(xg, yg, xe, ye, 2.5,
+                                                       300),
+                            predict_spatial_vectorized(xg, yg, xe, ye,
+                                                       uniform, 300))
+
+    # Same for the model, where a scalar is applied to all electrodes:
+    model = models.ScoreboardModel(xystep=1, rho=200).build()
+    npt.assert_almost_equal(model.predict_percept(implants.ArgusII(stim=10)),
+                            model.predict_percept(
+                                implants.ArgusII(stim=10 * np.ones(60))))
+    npt.assert_almost_equal(model.predict_percept(implants.ArgusII(stim=0)),
+                            0)
+
+
+class RotatedScoreboardModel(models.ScoreboardModel):
+    """Scoreboard model whose grid is not rectangular in tissue coordinates"""
+
+    def get_tissue_coords(self, xdva, ydva):
+        xret, yret = super(RotatedScoreboardModel,
+                           self).get_tissue_coords(xdva, ydva)
+        return xret + 0.2 * yret, yret - 0.2 * xret
+
+
+@pytest.mark.parametrize('model_class',
+                         (models.ScoreboardModel, RotatedScoreboardModel))
+def test_ScoreboardModel_inactive_electrodes(model_class):
+    # Electrodes without current are skipped, which must not change the
+    # percept:
+    serial = model_class(engine='serial', xystep=1, rho=200).build()
+    joblib = model_class(engine='joblib', n_jobs=1, xystep=1,
+                         rho=200).build()
+    for stim in [{'A1': 1.0}, {'A1': 2.0, 'F10': 2.0},
+                 {'B3': 1.0, 'C4': -0.5, 'D5': 3.0}, np.zeros(60)]:
+        implant = implants.ArgusII(stim=stim)
+        with pytest.deprecated_call():
+            npt.assert_almost_equal(serial.predict_percept(implant),
+                                    joblib.predict_percept(implant))
+
+
+def test_ScoreboardModel__gauss_cache():
+    model = models.ScoreboardModel(xystep=1, rho=200).build()
+    npt.assert_equal(model._gauss_cache, None)
+    implant = implants.ArgusII(stim=np.ones(60))
+    model.predict_percept(implant)
+    cache = model._gauss_cache
+    # A new stimulus on the same implant reuses the Gaussians:
+    implant.stim = np.arange(60) / 60.0
+    percept = model.predict_percept(implant)
+    npt.assert_equal(model._gauss_cache is cache, True)
+    fresh = models.ScoreboardModel(xystep=1, rho=200).build()
+    npt.assert_almost_equal(percept, fresh.predict_percept(implant))
+    # Moving the implant or changing rho invalidates the cache:
+    implant = implants.ArgusII(x=100, stim=np.arange(60) / 60.0)
+    npt.assert_almost_equal(model.predict_percept(implant),
+                            fresh.predict_percept(implant))
+    npt.assert_equal(model._gauss_cache is cache, False)
+    cache = model._gauss_cache
+    model.rho = 100
+    fresh.rho = 100
+    npt.assert_almost_equal(model.predict_percept(implant),
+                            fresh.predict_percept(implant))
+    npt.assert_equal(model._gauss_cache is cache, False)
+    # Building the model clears the cache:
+    model.build(xystep=2)
+    npt.assert_equal(model._gauss_cache, None)
+
+
+def test_ScoreboardModel_dtype():
+    implant = implants.ArgusII(stim=np.arange(60) / 60.0)
+    model64 = models.ScoreboardModel(engine='serial', xystep=1, rho=200)
+    percept64 = model64.build().predict_percept(implant)
+    npt.assert_equal(percept64.dtype, np.float64)
+    model32 = models.ScoreboardModel(engine='serial', xystep=1, rho=200,
+                                     dtype=np.float32)
+    percept32 = model32.build().predict_percept(implant)
+    npt.assert_equal(percept32.dtype, np.float32)
+    npt.assert_almost_equal(percept32, percept64, decimal=5)
+
+    # The tissue coordinates are stored in that precision during the build:
+    for model, dtype in [(model64, np.float64), (model32, np.float32)]:
+        for coords in [model.xret, model.yret]:
+            npt.assert_equal(coords.dtype, dtype)
+            npt.assert_equal(coords.flags['C_CONTIGUOUS'], True)
+        npt.assert_equal(model._is_separable, True)
+    model = RotatedScoreboardModel(xystep=1, dtype='float32').build()
+    npt.assert_equal(model.xret.dtype, np.float32)
+    npt.assert_equal(model._is_separable, False)
+
+
+@pytest.mark.skipif(not has_jit, reason="Numba not installed")
+@pytest.mark.parametrize('dtype', (np.float32, 'float32', np.dtype('float32'),
+                                   'float64'))
+def test_ScoreboardModel_dtype_numba(dtype):
+    # A grid that is not rectangular in tissue coordinates goes through the
+    # Numba kernel, which accepts all ways of specifying a dtype:
+    implant = implants.ArgusII(stim=np.arange(60) / 60.0)
+    model = RotatedScoreboardModel(xystep=1, rho=200, dtype=dtype).build()
+    percept = model.predict_percept(implant)
+    npt.assert_equal(percept.dtype, np.dtype(dtype))
+    reference = RotatedScoreboardModel(xystep=1, rho=200).build()
+    npt.assert_almost_equal(percept, reference.predict_percept(implant),
+                            decimal=5)
+
+
+@pytest.mark.skipif(not has_jit, reason="Numba not installed")
+def test_scoreboard_kernel_float32():
+    xg, yg = np.meshgrid(np.linspace(-2000, 2000, 31, dtype=np.float32),
+                         np.linspace(-1500, 1500, 23, dtype=np.float32))
+    xe = np.array([-500, 0, 800], dtype=np.float32)
+    ye = np.array([300, 0, -200], dtype=np.float32)
+    amps = np.array([1, 2, 0.5], dtype=np.float32)
+    bright = np.empty(xg.size, dtype=np.float32)
+    scoreboard_kernel(xg.ravel(), yg.ravel(), xe, ye, amps,
+                      np.float32(0.5 / 150 ** 2), np.float32(0), bright)
+    npt.assert_almost_equal(bright.reshape(xg.shape),
+                            predict_spatial_vectorized(xg, yg, xe, ye, amps,
+                                                       150), decimal=5)
+
+
+@pytest.mark.skipif(not is_cuda_available(),
+                    reason="No CUDA-capable GPU")
+def test_ScoreboardModel_cuda():
+    implant = implants.ArgusII(stim=np.arange(60) / 60.0)
+    cuda = models.ScoreboardModel(engine='cuda', xystep=2, rho=200)
+    serial = models.ScoreboardModel(engine='serial', xystep=2, rho=200)
+    npt.assert_almost_equal(cuda.build().predict_percept(implant),
+                            serial.build().predict_percept(implant))
+
+
+@pytest.mark.skipif(is_cuda_available(),
+                    reason="CUDA-capable GPU available")
+def test_ScoreboardModel_cuda_unavailable():
+    model = models.ScoreboardModel(engine='cuda', xystep=2).build()
+    with pytest.raises(ImportError):
+        model.predict_percept(implants.ArgusII(stim=np.ones(60)))
@@ -285,23 +285,19 @@ class Stimulus(PrettyPrint):
             # You always need the first and last element. You also need the
             # high and low value (along with the time stamps) for every signal
             # edge.
-            ticks = []  # sparsified time stamps
-            signal = []  # sparsified signal values
-            for t in range(data.shape[-1]):
-                if t == 0 or t == data.shape[-1] - 1:
-                    # Always need the first and last element:
-                    ticks.append(time[t])
-                    signal.append(data[:, t])
-                else:
-                    if not np.allclose(data[:, t], data[:, t - 1]):
-                        ticks.append(time[t - 1])
-                        signal.append(data[:, t - 1])
-                        ticks.append(time[t])
-                        signal.append(data[:, t])
-            # NumPy made the slices row vectors instead of column vectors, so
-            # now we need to vertically stack them and transpose:
-            data = np.vstack(signal).T
-            time = np.array(ticks)
+            n_time = data.shape[-1]
+            if n_time > 1:
+                # Find all inner columns that differ from their predecessor:
+                edges = np.flatnonzero(~np.all(np.isclose(data[:, 1:-1],
+                                                          data[:, :-2]),
+                                               axis=0)) + 1
+                # Every edge ``t`` contributes columns ``t - 1`` and ``t``:
+                edges = np.column_stack((edges - 1, edges)).ravel()
+                keep_t = np.concatenate(([0], edges, [n_time - 1]))
+            else:
+                keep_t = np.array([0])
+            data = data[:, keep_t]
+            time = np.asarray(time)[keep_t]
         self._stim = {
             'data': data,
             'electrodes': electrodes,
@@ -55,6 +55,34 @@ def _sparseconv(data, kernel, mode):
         return center_vector(out, data_len)
 
 
+def _segmentconv(data, kernel, mode):
+    """Convolves only the nonzero segment of a 1D sequence using FFT
+
+    Stimuli such as a single pulse followed by a long stretch of silence are
+    mostly zero. Only the samples between the first and last nonzero value of
+    ``data`` contribute to the convolution, so the FFT is computed on that
+    segment only and the result is zero-padded to the requested size.
+    Returns the same result as ``scipy.signal.fftconvolve``.
+    """
+    data_len = data.size
+    kernel_len = kernel.size
+    nonzero = np.flatnonzero(data)
+    if nonzero.size > 0:
+        start, stop = nonzero[0], nonzero[-1] + 1
+        segment = sps.fftconvolve(data[start:stop], kernel, 'full')
+        out = np.zeros(data_len + kernel_len - 1, dtype=segment.dtype)
+        out[start:start + segment.size] = segment
+    else:
+        out = np.zeros(data_len + kernel_len - 1,
+                       dtype=np.result_type(data, kernel, float))
+    if mode.lower() == 'full':
+        return out
+    elif mode.lower() == 'valid':
+        return center_vector(out, data_len - kernel_len + 1)
+    elif mode.lower() == 'same':
+        return center_vector(out, data_len)
+
+
 def conv(data, kernel, mode='full', method='fft', use_jit=True):
     """Convoles data with a kernel using either FFT or sparse convolution
 
@@ -98,7 +126,15 @@ def conv(data, kernel, mode='full', method='fft', use_jit=True):
         raise ValueError("Acceptable methods are: 'fft', 'sparse'.")
     if method.lower() == 'fft':
         # Use FFT: faster on non-sparse data
-        conved = sps.fftconvolve(data, kernel, mode)
+        data = np.asarray(data)
+        kernel = np.asarray(kernel)
+        if (data.ndim == 1 and kernel.ndim == 1 and data.size > 0 and
+                (mode != 'valid' or data.size >= kernel.size) and
+                (data[0] == 0 or data[-1] == 0)):
+            # Leading or trailing zeros in the data can be skipped:
+            conved = _segmentconv(data, kernel, mode)
+        else:
+            conved = sps.fftconvolve(data, kernel, mode)
     elif method.lower() == 'sparse':
         # Use sparseconv: faster on sparse data
         if use_jit:
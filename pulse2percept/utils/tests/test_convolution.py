@@ -8,12 +8,9 @@ from unittest import mock
 from imp import reload
 
 
-@pytest.mark.slow
-@pytest.mark.parametrize('mode', ('full', 'valid', 'same'))
-@pytest.mark.parametrize('method', ('sparse', 'fft'))
-@pytest.mark.parametrize('use_jit', (True, False))
-def test_conv(mode, method, use_jit):
-    reload(convolution)
+@pytest.fixture(scope='module')
+def conv_data():
+    """Builds the stimulus, kernel, and reference output once per module"""
     # time vector for stimulus (long)
     stim_dur = 0.5  # seconds
     tsample = 0.001 / 1000
@@ -27,12 +24,25 @@ def test_conv(mode, method, use_jit):
     # kernel
     _, gg = gamma(1, 0.005, tsample)
 
+    # np.convolve is slow, so calculate the ground truth only once per mode:
+    npconv = {mode: np.convolve(stim, gg, mode=mode)
+              for mode in ('full', 'valid', 'same')}
+    return stim, gg, npconv
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('mode', ('full', 'valid', 'same'))
+@pytest.mark.parametrize('method', ('sparse', 'fft'))
+@pytest.mark.parametrize('use_jit', (True, False))
+def test_conv(conv_data, mode, method, use_jit):
+    reload(convolution)
+    stim, gg, npconv = conv_data
+
     # make sure conv returns the same result as np.convolve for all modes:
-    npconv = np.convolve(stim, gg, mode=mode)
     conv = convolution.conv(stim, gg, mode=mode, method=method,
                             use_jit=use_jit)
-    npt.assert_equal(conv.shape, npconv.shape)
-    npt.assert_almost_equal(conv, npconv)
+    npt.assert_equal(conv.shape, npconv[mode].shape)
+    npt.assert_almost_equal(conv, npconv[mode])
 
     with pytest.raises(ValueError):
         convolution.conv(gg, stim, mode="invalid", use_jit=use_jit)
@@ -44,3 +54,25 @@ def test_conv(mode, method, use_jit):
             reload(convolution)
             convolution.conv(stim, gg, mode='full', method='sparse',
                              use_jit=True)
+
+
+@pytest.mark.parametrize('mode', ('full', 'valid', 'same'))
+def test_conv_segment(mode):
+    # A single pulse followed by a long stretch of zeros: only the nonzero
+    # segment is convolved, but the result must not change:
+    tsample = 0.005 / 1000
+    _, gg = gamma(1, 0.005, tsample)
+    for offset in [0, 10, 500]:
+        stim = np.zeros(20000)
+        stim[offset:offset + 200] = -20
+        stim[offset + 200:offset + 400] = 20
+        conv = convolution.conv(stim, gg, mode=mode, method='fft')
+        npt.assert_equal(conv.shape, np.convolve(stim, gg, mode=mode).shape)
+        npt.assert_almost_equal(conv, np.convolve(stim, gg, mode=mode))
+    # All zeros:
+    stim = np.zeros(20000)
+    npt.assert_almost_equal(convolution.conv(stim, gg, mode=mode),
+                            np.convolve(stim, gg, mode=mode))
+    # Empty data gives an empty result:
+    npt.assert_equal(convolution.conv(np.array([]), gg, mode=mode,
+                                      method='fft').size, 0)
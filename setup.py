@@ -8,6 +8,7 @@ import shutil
 from distutils.command.clean import clean as Clean
 from pkg_resources import parse_version
 import traceback
+from setuptools import setup, find_packages
 try:
     import builtins
 except ImportError:
@@ -39,31 +40,16 @@ PROJECT_URLS = {
 }
 
 
-# Optional setuptools features
-# We need to import setuptools early, if we want setuptools features,
-# as it monkey-patches the 'setup' function
-# For some commands, use setuptools
-SETUPTOOLS_COMMANDS = {
-    'develop', 'release', 'bdist_egg', 'bdist_rpm',
-    'bdist_wininst', 'install_egg_info', 'build_sphinx',
-    'egg_info', 'easy_install', 'upload', 'bdist_wheel',
-    '--single-version-externally-managed',
-}
-if SETUPTOOLS_COMMANDS.intersection(sys.argv):
-    import setuptools
-
-    extra_setuptools_args = dict(
-        zip_safe=False,  # the package can run out of an .egg file
-        include_package_data=True,
-        extras_require={
-            'alldeps': (
-                'numpy >= {}'.format(NUMPY_MIN_VERSION),
-                'scipy >= {}'.format(SCIPY_MIN_VERSION),
-            ),
-        },
-    )
-else:
-    extra_setuptools_args = dict()
+extra_setuptools_args = dict(
+    zip_safe=False,  # the package can run out of an .egg file
+    include_package_data=True,
+    extras_require={
+        'alldeps': (
+            'numpy >= {}'.format(NUMPY_MIN_VERSION),
+            'scipy >= {}'.format(SCIPY_MIN_VERSION),
+        ),
+    },
+)
 
 
 class CleanCommand(Clean):
@@ -97,24 +83,54 @@ class CleanCommand(Clean):
 cmdclass = {'clean': CleanCommand}
 
 
-def configuration(parent_package='', top_path=None):
-    if os.path.exists('MANIFEST'):
-        os.remove('MANIFEST')
-
-    from numpy.distutils.misc_util import Configuration
-
-    config = Configuration(None, parent_package, top_path)
-
-    # Avoid non-useful msg:
-    # "Ignoring attempt to set 'name' (from ... "
-    config.set_options(ignore_setup_xxx_py=True,
-                       assume_default_configuration=True,
-                       delegate_options_to_subpackages=True,
-                       quiet=True)
+def get_openmp_flags():
+    """Returns the compiler and linker flags needed to enable OpenMP
 
-    config.add_subpackage('pulse2percept')
-
-    return config
+    Extensions are still built if OpenMP is not available (e.g., with the
+    default Apple Clang); ``prange`` loops will then simply run serially.
+    """
+    if sys.platform.startswith('win'):
+        return ['/openmp'], []
+    if sys.platform == 'darwin':
+        return [], []
+    return ['-fopenmp'], ['-fopenmp']
+
+
+def get_extensions():
+    """Returns all Cython extensions, ready to be built by setuptools"""
+    import numpy
+    from Cython.Build import cythonize
+    from setuptools import Extension
+
+    if platform.python_implementation() == 'PyPy':
+        return []
+
+    libraries = []
+    if os.name == 'posix':
+        libraries.append('m')
+    openmp_compile_args, openmp_link_args = get_openmp_flags()
+    extra_compile_args = openmp_compile_args
+    if not sys.platform.startswith('win'):
+        extra_compile_args = ['-O3'] + extra_compile_args
+
+    # All spatial kernels live in a single extension, so that they can share
+    # inlined helper functions:
+    extensions = [
+        Extension('pulse2percept.models._spatial',
+                  sources=['pulse2percept/models/_spatial.pyx'],
+                  include_dirs=[numpy.get_include()],
+                  libraries=libraries,
+                  extra_compile_args=extra_compile_args,
+                  extra_link_args=openmp_link_args)
+    ]
+    # https://cython.readthedocs.io/en/latest/src/userguide/source_files_and_compilation.html#compiler-directives
+    return cythonize(extensions,
+                     compiler_directives={
+                         'language_level': 3,  # use Py3 runtime
+                         'boundscheck': False,  # no IndexError
+                         'wraparound': False,  # no arr[-1]
+                         'initializedcheck': False,  # no None
+                     })
 
 
 def get_numpy_status():
@@ -189,6 +205,8 @@ def setup_package():
                                   'Implementation :: PyPy')
                                  ],
                     cmdclass=cmdclass,
+                    packages=find_packages(include=['pulse2percept',
+                                                    'pulse2percept.*']),
                     python_requires=">=3.5",
                     install_requires=[
                         'numpy>={}'.format(NUMPY_MIN_VERSION),
@@ -208,11 +226,6 @@ def setup_package():
         # They are required to succeed without NumPy for example when
         # pip is used to install pulse2percept when NumPy is not yet present in
         # the system.
-        try:
-            from setuptools import setup
-        except ImportError:
-            from distutils.core import setup
-
         metadata['version'] = VERSION
     else:
         if sys.version_info < (3, 5):
@@ -239,7 +252,6 @@ def setup_package():
                 raise ImportError("Numerical Python (NumPy) is not "
                                   "installed.\n{}{}"
                                   .format(numpy_req_str, instructions))
-        from numpy.distutils.core import setup
 
         # Make sure Cython is installed:
         cython_status = get_cython_status()
@@ -257,7 +269,7 @@ def setup_package():
                                   "installed.\n{}{}"
                                   .format(cython_req_str, instructions))
 
-        metadata['configuration'] = configuration
+        metadata['ext_modules'] = get_extensions()
 
     setup(**metadata)
 